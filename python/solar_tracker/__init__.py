@@ -33,6 +33,7 @@ from .angles import (
     solar_azimuth,
     solar_declination,
     solar_position,
+    solar_position_from_ts,
     solar_zenith_angle,
     utc_lst_correction,
 )
@@ -45,7 +46,9 @@ from .lookup_table import (
     interpolate_angle,
     intervals_per_day,
     lookup_dual_axis,
+    lookup_dual_axis_batch,
     lookup_single_axis,
+    lookup_single_axis_batch,
     minutes_to_time,
     table_to_compact,
     time_to_minutes,
@@ -86,6 +89,7 @@ __all__ = [
     "solar_azimuth",
     "solar_declination",
     "solar_position",
+    "solar_position_from_ts",
     "solar_zenith_angle",
     "utc_lst_correction",
     # Lookup table
@@ -96,7 +100,9 @@ __all__ = [
     "interpolate_angle",
     "intervals_per_day",
     "lookup_dual_axis",
+    "lookup_dual_axis_batch",
     "lookup_single_axis",
+    "lookup_single_axis_batch",
     "minutes_to_time",
     "table_to_compact",
     "time_to_minutes",
@@ -1,9 +1,16 @@
-"""Frozen dataclasses for all structured return types."""
+"""Frozen, slotted dataclasses for all structured return types."""
 
-from dataclasses import dataclass
+import math
+from array import array
+from dataclasses import dataclass, field, fields
 from enum import StrEnum
 
 
+def _value_or_none(v: float) -> float | None:
+    """Convert a stored NaN (nighttime) value back to None."""
+    return None if math.isnan(v) else v
+
+
 class Season(StrEnum):
     SUMMER = "summer"
     WINTER = "winter"
@@ -11,7 +18,7 @@ class Season(StrEnum):
     FALL = "fall"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SolarPosition:
     day_of_year: int
     declination: float
@@ -23,47 +30,82 @@ class SolarPosition:
     azimuth: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DualAxisAngles:
     tilt: float
     panel_azimuth: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SunriseSunset:
     sunrise: int
     sunset: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SingleAxisEntry:
     minutes: int
     rotation: float | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DualAxisEntry:
     minutes: int
     tilt: float | None
     panel_azimuth: float | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DayData:
+    """Per-day table data stored column-wise.
+
+    minutes is a range over the UTC minutes of the entries, which lie on
+    the table's interval grid, so it needs no per-entry storage. values
+    holds one float32 column per angle field of entry_type (rotation, or
+    tilt and panel_azimuth), with NaN marking nighttime entries.
+    """
+
     day_of_year: int
     sunrise_minutes: int
     sunset_minutes: int
-    entries: list
-
-
-@dataclass(frozen=True)
+    minutes: range
+    # Left out of the generated __hash__ (arrays are unhashable); __eq__
+    # compares it by content, since NaN != NaN would make equal days unequal
+    values: tuple[array, ...] = field(compare=False)
+    entry_type: type
+
+    def _eq_key(self) -> tuple:
+        return tuple(
+            (
+                tuple(column.tobytes() for column in self.values)
+                if f.name == "values"
+                else getattr(self, f.name)
+            )
+            for f in fields(self)
+        )
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._eq_key() == other._eq_key()
+
+    @property
+    def entries(self) -> list:
+        """Materialize the columns as entry_type instances (NaN becomes None)."""
+        return [
+            self.entry_type(m, *[_value_or_none(v) for v in row])
+            for m, row in zip(self.minutes, zip(*self.values))
+        ]
+
+
+@dataclass(frozen=True, slots=True)
 class TableMetadata:
-    generated_at: str
+    generated_at: int
     total_entries: int
     storage_estimate_kb: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LookupTableConfig:
     interval_minutes: int = 5
     latitude: float = 39.8
@@ -73,7 +115,7 @@ class LookupTableConfig:
     sunset_buffer_minutes: int = 30
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LookupTable:
     config: LookupTableConfig
     days: list[DayData]
@@ -3,23 +3,36 @@
 All angles in degrees unless otherwise noted.
 """
 
+import functools
 import math
-from datetime import datetime as DateTime, timezone
+from datetime import date, datetime as DateTime, timezone
 
 from ._types import DualAxisAngles, Season, SolarPosition
 
 EARTH_AXIAL_TILT = 23.45
 DEGREES_PER_HOUR = 15.0
 
+# Proleptic Gregorian ordinal of 1970-01-01, the POSIX timestamp epoch
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Days before the first of each month (cumulative days_in_months)
+_MONTH_OFFSETS_COMMON = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+_MONTH_OFFSETS_LEAP = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
+
+
+# Conversion factors, used directly in internal code to avoid a function call
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
 
 def deg_to_rad(deg: float) -> float:
     """Convert degrees to radians."""
-    return deg * (math.pi / 180.0)
+    return deg * _DEG2RAD
 
 
 def rad_to_deg(rad: float) -> float:
     """Convert radians to degrees."""
-    return rad * (180.0 / math.pi)
+    return rad * _RAD2DEG
 
 
 def normalize_angle(angle: float) -> float:
@@ -37,9 +50,14 @@ def days_in_months(year: int) -> list[int]:
     return [31, 29 if leap_year(year) else 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
 
 
+def _month_offsets(year: int) -> tuple[int, ...]:
+    """Returns the days before the first of each month for the given year."""
+    return _MONTH_OFFSETS_LEAP if leap_year(year) else _MONTH_OFFSETS_COMMON
+
+
 def day_of_year(year: int, month: int, day: int) -> int:
     """Calculate day of year (1-366) from year, month, day."""
-    return sum(days_in_months(year)[: month - 1]) + day
+    return _month_offsets(year)[month - 1] + day
 
 
 def intermediate_angle_b(n: int) -> float:
@@ -48,15 +66,10 @@ def intermediate_angle_b(n: int) -> float:
     Input: n = day of year (1-365)
     Output: B in radians
     """
-    return deg_to_rad((n - 1) * (360.0 / 365.0))
-
+    return (n - 1) * (360.0 / 365.0) * _DEG2RAD
 
-def equation_of_time(n: int) -> float:
-    """Calculate the Equation of Time correction.
 
-    Input: n = day of year (1-365)
-    Output: correction in minutes
-    """
+def _equation_of_time(n: int) -> float:
     b = intermediate_angle_b(n)
     return 229.18 * (
         0.000075
@@ -67,6 +80,20 @@ def equation_of_time(n: int) -> float:
     )
 
 
+# Equation of time for every day of year (and day 0), computed once at import
+_EOT_BY_DAY = {n: _equation_of_time(n) for n in range(367)}
+
+
+def equation_of_time(n: int) -> float:
+    """Calculate the Equation of Time correction.
+
+    Input: n = day of year (1-365)
+    Output: correction in minutes
+    """
+    eot = _EOT_BY_DAY.get(n)
+    return _equation_of_time(n) if eot is None else eot
+
+
 def utc_lst_correction(longitude: float, eot: float) -> float:
     """Calculate the UTC-to-local-solar-time correction in hours.
 
@@ -91,6 +118,14 @@ def hour_angle(local_solar_time: float) -> float:
     return DEGREES_PER_HOUR * (local_solar_time - 12.0)
 
 
+def _solar_declination(n: int) -> float:
+    return EARTH_AXIAL_TILT * math.sin(360.0 * ((284 + n) / 365.0) * _DEG2RAD)
+
+
+# Solar declination for every day of year (and day 0), computed once at import
+_DECLINATION_BY_DAY = {n: _solar_declination(n) for n in range(367)}
+
+
 def solar_declination(n: int) -> float:
     """Calculate solar declination angle.
 
@@ -99,24 +134,40 @@ def solar_declination(n: int) -> float:
 
     Ranges from -23.45 deg (winter solstice) to +23.45 deg (summer solstice).
     """
-    return EARTH_AXIAL_TILT * math.sin(deg_to_rad(360.0 * ((284 + n) / 365.0)))
+    decl = _DECLINATION_BY_DAY.get(n)
+    return _solar_declination(n) if decl is None else decl
 
 
-def solar_zenith_angle(
-    latitude: float, declination: float, hour_angle: float
+def _solar_zenith_from_trig(
+    sin_lat: float, cos_lat: float, sin_dec: float, cos_dec: float, cos_ha: float
 ) -> float:
-    """Calculate the solar zenith angle.
+    """Calculate the solar zenith angle from precomputed sin/cos values.
 
     Returns zenith angle in degrees.
     """
-    lat_rad = deg_to_rad(latitude)
-    dec_rad = deg_to_rad(declination)
-    ha_rad = deg_to_rad(hour_angle)
-    cos_zenith = math.sin(lat_rad) * math.sin(dec_rad) + math.cos(
-        lat_rad
-    ) * math.cos(dec_rad) * math.cos(ha_rad)
+    cos_zenith = sin_lat * sin_dec + cos_lat * cos_dec * cos_ha
     # Clamp to [-1, 1] to handle floating point errors
-    return rad_to_deg(math.acos(max(-1.0, min(1.0, cos_zenith))))
+    if cos_zenith > 1.0:
+        cos_zenith = 1.0
+    elif cos_zenith < -1.0:
+        cos_zenith = -1.0
+    return math.acos(cos_zenith) * _RAD2DEG
+
+
+def solar_zenith_angle(latitude: float, declination: float, hour_angle: float) -> float:
+    """Calculate the solar zenith angle.
+
+    Returns zenith angle in degrees.
+    """
+    lat_rad = latitude * _DEG2RAD
+    dec_rad = declination * _DEG2RAD
+    return _solar_zenith_from_trig(
+        math.sin(lat_rad),
+        math.cos(lat_rad),
+        math.sin(dec_rad),
+        math.cos(dec_rad),
+        math.cos(hour_angle * _DEG2RAD),
+    )
 
 
 def solar_altitude(zenith_angle: float) -> float:
@@ -124,6 +175,23 @@ def solar_altitude(zenith_angle: float) -> float:
     return 90.0 - zenith_angle
 
 
+def _solar_azimuth_from_trig(
+    sin_lat: float,
+    cos_lat: float,
+    sin_dec: float,
+    cos_dec: float,
+    sin_ha: float,
+    cos_ha: float,
+) -> float:
+    """Calculate solar azimuth angle from precomputed sin/cos values.
+
+    Returns azimuth in degrees (0=North, 90=East, 180=South, 270=West).
+    """
+    sin_az = -cos_dec * sin_ha
+    cos_az = sin_dec * cos_lat - cos_dec * sin_lat * cos_ha
+    return normalize_angle(math.atan2(sin_az, cos_az) * _RAD2DEG)
+
+
 def solar_azimuth(
     latitude: float,
     declination: float,
@@ -133,15 +201,17 @@ def solar_azimuth(
 
     Returns azimuth in degrees (0=North, 90=East, 180=South, 270=West).
     """
-    lat_rad = deg_to_rad(latitude)
-    dec_rad = deg_to_rad(declination)
-    ha_rad = deg_to_rad(hour_angle)
-    sin_az = -1.0 * math.cos(dec_rad) * math.sin(ha_rad)
-    cos_az = math.sin(dec_rad) * math.cos(lat_rad) - math.cos(dec_rad) * math.sin(
-        lat_rad
-    ) * math.cos(ha_rad)
-    az_rad = math.atan2(sin_az, cos_az)
-    return normalize_angle(rad_to_deg(az_rad))
+    lat_rad = latitude * _DEG2RAD
+    dec_rad = declination * _DEG2RAD
+    ha_rad = hour_angle * _DEG2RAD
+    return _solar_azimuth_from_trig(
+        math.sin(lat_rad),
+        math.cos(lat_rad),
+        math.sin(dec_rad),
+        math.cos(dec_rad),
+        math.sin(ha_rad),
+        math.cos(ha_rad),
+    )
 
 
 def solar_angles_at(
@@ -154,21 +224,81 @@ def solar_angles_at(
     """
     lst = (utc_hours + correction) % 24.0
     ha = hour_angle(lst)
-    z = solar_zenith_angle(latitude, decl, ha)
-    alt = solar_altitude(z)
-    azim = solar_azimuth(latitude, decl, ha)
-    return lst, ha, z, alt, azim
+    # Compute each trig value once and share it between zenith and azimuth
+    lat_rad = latitude * _DEG2RAD
+    dec_rad = decl * _DEG2RAD
+    ha_rad = ha * _DEG2RAD
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+    sin_dec = math.sin(dec_rad)
+    cos_dec = math.cos(dec_rad)
+    cos_ha = math.cos(ha_rad)
+    z = _solar_zenith_from_trig(sin_lat, cos_lat, sin_dec, cos_dec, cos_ha)
+    azim = _solar_azimuth_from_trig(
+        sin_lat, cos_lat, sin_dec, cos_dec, math.sin(ha_rad), cos_ha
+    )
+    return lst, ha, z, solar_altitude(z), azim
 
 
-def solar_position(
-    latitude: float, longitude: float, dt: DateTime
-) -> SolarPosition:
-    """Calculate complete solar position for given location and timezone-aware datetime."""
+def solar_position(latitude: float, longitude: float, dt: DateTime) -> SolarPosition:
+    """Calculate complete solar position for given location and timezone-aware datetime.
+
+    Results are cached on location and UTC time (to the second), so
+    repeated queries for the same instant skip the calculation.
+    """
     if dt.tzinfo is None:
         raise ValueError("dt must be timezone-aware")
     utc = dt.astimezone(timezone.utc)
-    utc_hours = utc.hour + utc.minute / 60.0 + utc.second / 3600.0
-    n = day_of_year(utc.year, utc.month, utc.day)
+    return _solar_position_utc(
+        latitude,
+        longitude,
+        utc.year,
+        utc.month,
+        utc.day,
+        utc.hour,
+        utc.minute,
+        utc.second,
+    )
+
+
+def solar_position_from_ts(
+    latitude: float, longitude: float, ts_utc: float
+) -> SolarPosition:
+    """Calculate complete solar position for a POSIX timestamp (seconds, UTC).
+
+    Same result as solar_position for the equivalent UTC datetime, but the
+    date and time of day are derived arithmetically, with no tzinfo handling.
+    """
+    days, seconds = divmod(math.floor(ts_utc), 86400)
+    utc_date = date.fromordinal(_UNIX_EPOCH_ORDINAL + days)
+    hour, seconds = divmod(seconds, 3600)
+    minute, second = divmod(seconds, 60)
+    return _solar_position_utc(
+        latitude,
+        longitude,
+        utc_date.year,
+        utc_date.month,
+        utc_date.day,
+        hour,
+        minute,
+        second,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _solar_position_utc(
+    latitude: float,
+    longitude: float,
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    second: int,
+) -> SolarPosition:
+    """Calculate solar position from UTC date and time components."""
+    utc_hours = hour + minute / 60.0 + second / 3600.0
+    n = day_of_year(year, month, day)
     eot = equation_of_time(n)
     decl = solar_declination(n)
     correction = utc_lst_correction(longitude, eot)
@@ -190,9 +320,9 @@ def single_axis_tilt(pos: SolarPosition, latitude: float) -> float:
 
     Returns rotation angle in degrees (positive = tilted toward west).
     """
-    ha_rad = deg_to_rad(pos.hour_angle)
-    lat_rad = deg_to_rad(latitude)
-    return rad_to_deg(math.atan(math.tan(ha_rad) / math.cos(lat_rad)))
+    ha_rad = pos.hour_angle * _DEG2RAD
+    lat_rad = latitude * _DEG2RAD
+    return math.atan(math.tan(ha_rad) / math.cos(lat_rad)) * _RAD2DEG
 
 
 def dual_axis_angles(pos: SolarPosition) -> DualAxisAngles:
@@ -5,10 +5,13 @@ with configurable interval and sunrise/sunset buffers.
 Tables are indexed by UTC minutes.
 """
 
-import datetime
+import bisect
+import functools
 import math
-from types import SimpleNamespace
-from typing import Callable
+import time
+from array import array
+from dataclasses import fields
+from typing import Callable, Sequence
 
 from . import angles
 from ._types import (
@@ -19,6 +22,7 @@ from ._types import (
     SingleAxisEntry,
     SunriseSunset,
     TableMetadata,
+    _value_or_none,
 )
 
 DEFAULT_CONFIG = LookupTableConfig()
@@ -26,7 +30,7 @@ DEFAULT_CONFIG = LookupTableConfig()
 
 def minutes_to_time(total_minutes: int) -> tuple[int, int]:
     """Convert minutes since midnight to (hour, minute)."""
-    return (total_minutes // 60, total_minutes % 60)
+    return divmod(total_minutes, 60)
 
 
 def time_to_minutes(t: tuple[int, int]) -> int:
@@ -39,27 +43,50 @@ def intervals_per_day(interval_minutes: int) -> int:
     return 1440 // interval_minutes
 
 
+def _month_day_from_offsets(
+    offsets: tuple[int, ...], n_days: int, doy: int
+) -> tuple[int, int]:
+    """Convert day-of-year to (month, day) by bisecting month offsets.
+
+    Days outside the year clamp as they always have: past the last day is
+    (12, 31), and day 0 or earlier stays in January as (1, doy).
+    """
+    if doy > n_days:
+        return (12, 31)
+    month = max(1, bisect.bisect_right(offsets, doy - 1))
+    return (month, doy - offsets[month - 1])
+
+
+def _month_day_by_doy(offsets: tuple[int, ...], n_days: int) -> dict:
+    return {
+        doy: _month_day_from_offsets(offsets, n_days, doy)
+        for doy in range(1, n_days + 1)
+    }
+
+
+# (month, day) for every day of a common and a leap year, built once at import
+_MONTH_DAY_COMMON = _month_day_by_doy(angles._MONTH_OFFSETS_COMMON, 365)
+_MONTH_DAY_LEAP = _month_day_by_doy(angles._MONTH_OFFSETS_LEAP, 366)
+
+
 def doy_to_month_day(year: int, doy: int) -> tuple[int, int]:
     """Convert day-of-year to (month, day) for a given year."""
-    remaining = doy
-    for month_idx, dim in enumerate(angles.days_in_months(year)):
-        if remaining <= dim:
-            return (month_idx + 1, remaining)
-        remaining -= dim
-    return (12, 31)  # shouldn't reach here for valid input
+    if angles.leap_year(year):
+        by_doy, offsets, n_days = _MONTH_DAY_LEAP, angles._MONTH_OFFSETS_LEAP, 366
+    else:
+        by_doy, offsets, n_days = _MONTH_DAY_COMMON, angles._MONTH_OFFSETS_COMMON, 365
+    month_day = by_doy.get(doy)
+    if month_day is not None:
+        return month_day
+    # Outside the year: clamped as documented in _month_day_from_offsets
+    return _month_day_from_offsets(offsets, n_days, doy)
 
 
-def estimate_sunrise_sunset(latitude: float, day_of_year: int) -> SunriseSunset:
-    """Estimate sunrise and sunset times for a given day.
+def _sunrise_sunset_from_cos_h(cos_h: float) -> SunriseSunset:
+    """Convert cos of the sunrise hour angle into sunrise/sunset minutes.
 
-    Returns SunriseSunset with sunrise/sunset as minutes from midnight (local solar time).
-    Uses the hour angle at sunrise/sunset formula: cos(h) = -tan(lat) * tan(decl)
+    Handles the polar cases where cos_h falls outside [-1, 1].
     """
-    lat_rad = angles.deg_to_rad(latitude)
-    decl = angles.solar_declination(day_of_year)
-    decl_rad = angles.deg_to_rad(decl)
-    cos_h = -1.0 * math.tan(lat_rad) * math.tan(decl_rad)
-
     if cos_h >= 1.0:
         # Polar night: sun never rises
         return SunriseSunset(sunrise=720, sunset=720)
@@ -67,7 +94,7 @@ def estimate_sunrise_sunset(latitude: float, day_of_year: int) -> SunriseSunset:
         # Polar day: sun never sets
         return SunriseSunset(sunrise=0, sunset=1440)
     else:
-        h_deg = angles.rad_to_deg(math.acos(cos_h))
+        h_deg = math.acos(cos_h) * angles._RAD2DEG
         half_day_minutes = (h_deg / 15.0) * 60.0
         solar_noon_minutes = 720
         return SunriseSunset(
@@ -76,112 +103,257 @@ def estimate_sunrise_sunset(latitude: float, day_of_year: int) -> SunriseSunset:
         )
 
 
+def _declination_trig(doy: int) -> tuple[float, float, float]:
+    dec_rad = angles.solar_declination(doy) * angles._DEG2RAD
+    return math.sin(dec_rad), math.cos(dec_rad), math.tan(dec_rad)
+
+
+# (sin, cos, tan) of the declination for every day of year (and day 0).
+# Depends on nothing but the day, so every table shares it.
+_DECLINATION_TRIG = tuple(_declination_trig(doy) for doy in range(367))
+
+
+@functools.lru_cache(maxsize=16)
+def _sunrise_sunset_by_day(latitude: float) -> tuple[SunriseSunset, ...]:
+    """Sunrise/sunset for every day of year (and day 0) at a latitude.
+
+    Declination depends only on the day, so one pass per latitude serves
+    every year's table at that latitude.
+    """
+    # Latitude term of the sunrise hour angle formula, constant for the year
+    tan_lat = math.tan(latitude * angles._DEG2RAD)
+    return tuple(
+        _sunrise_sunset_from_cos_h(-1.0 * tan_lat * tan_dec)
+        for _, _, tan_dec in _DECLINATION_TRIG
+    )
+
+
+def estimate_sunrise_sunset(latitude: float, day_of_year: int) -> SunriseSunset:
+    """Estimate sunrise and sunset times for a given day.
+
+    Returns SunriseSunset with sunrise/sunset as minutes from midnight (local solar time).
+    Uses the hour angle at sunrise/sunset formula: cos(h) = -tan(lat) * tan(decl)
+    """
+    lat_rad = latitude * angles._DEG2RAD
+    if isinstance(day_of_year, int) and 0 <= day_of_year < len(_DECLINATION_TRIG):
+        tan_dec = _DECLINATION_TRIG[day_of_year][2]
+    else:
+        decl = angles.solar_declination(day_of_year)
+        tan_dec = math.tan(decl * angles._DEG2RAD)
+    return _sunrise_sunset_from_cos_h(-1.0 * math.tan(lat_rad) * tan_dec)
+
+
+def _interpolate_angle_nan(a1: float, a2: float, fraction: float) -> float:
+    """interpolate_angle on stored floats, where NaN marks a missing angle.
+
+    Branch-free: NaN propagates through the arithmetic instead of needing
+    a None check.
+    """
+    diff = a2 - a1
+    # Shortest arc as in the Rust and Clojure versions, with the comparisons
+    # as 0/1 factors: exactly +180 and -180 both keep their sign
+    diff += 360.0 * ((diff < -180.0) - (diff > 180.0))
+    return (a1 + diff * fraction) % 360.0
+
+
 def interpolate_angle(
     a1: float | None, a2: float | None, fraction: float
 ) -> float | None:
     """Interpolate between two angles, handling 360 deg wraparound."""
     if a1 is None or a2 is None:
         return None
-    diff = a2 - a1
-    if diff > 180:
-        adjusted_diff = diff - 360
-    elif diff < -180:
-        adjusted_diff = diff + 360
-    else:
-        adjusted_diff = diff
-    return (a1 + adjusted_diff * fraction) % 360.0
+    return _interpolate_angle_nan(a1, a2, fraction)
 
 
-def _interpolate_linear(
-    v1: float | None, v2: float | None, fraction: float
-) -> float | None:
-    """Simple linear interpolation between two values."""
-    if v1 is None or v2 is None:
-        return None
-    return v1 + fraction * (v2 - v1)
-
-
-def _compute_angles_fast(sin_lat, cos_lat, sin_dec, cos_dec, correction, utc_hours):
-    """Compute solar angles using precomputed trig values for table generation."""
-    lst = (utc_hours + correction) % 24.0
-    ha = angles.DEGREES_PER_HOUR * (lst - 12.0)
-    ha_rad = angles.deg_to_rad(ha)
-    cos_z = sin_lat * sin_dec + cos_lat * cos_dec * math.cos(ha_rad)
-    zenith = angles.rad_to_deg(math.acos(max(-1.0, min(1.0, cos_z))))
-    sin_az = -1.0 * cos_dec * math.sin(ha_rad)
-    cos_az = sin_dec * cos_lat - cos_dec * sin_lat * math.cos(ha_rad)
-    azim = angles.normalize_angle(angles.rad_to_deg(math.atan2(sin_az, cos_az)))
-    return SimpleNamespace(
-        local_solar_time=lst,
-        hour_angle=ha,
-        zenith=zenith,
-        altitude=90.0 - zenith,
-        azimuth=azim,
-    )
+def _compute_angles_fast(
+    sin_lat, cos_lat, sin_dec, cos_dec, sin_ha, cos_ha, correction, utc_hours
+):
+    """Compute solar angles using precomputed trig values for table generation.
 
+    Returns (hour_angle, zenith, azimuth) in degrees.
+    """
+    ha = angles.DEGREES_PER_HOUR * ((utc_hours + correction) % 24.0 - 12.0)
+    cos_z = sin_lat * sin_dec + cos_lat * cos_dec * cos_ha
+    # Clamp to [-1, 1] with comparisons rather than max/min calls
+    if cos_z > 1.0:
+        cos_z = 1.0
+    elif cos_z < -1.0:
+        cos_z = -1.0
+    zenith = math.acos(cos_z) * angles._RAD2DEG
+    sin_az = -cos_dec * sin_ha
+    cos_az = sin_dec * cos_lat - cos_dec * sin_lat * cos_ha
+    # atan2 is within [-180, 180] deg, so one conditional add normalizes it.
+    # (A -0.0 result is harmless: the dual-axis entry_fn adds 180 first.)
+    azim = math.atan2(sin_az, cos_az) * angles._RAD2DEG
+    if azim < 0.0:
+        azim += 360.0
+    return ha, zenith, azim
+
+
+@functools.lru_cache(maxsize=8)
+def _interval_grid(
+    interval_minutes: int,
+) -> tuple[tuple[float, ...], tuple[float, ...], tuple[float, ...]]:
+    """Precompute per-interval values shared by every day of every table.
+
+    Returns (utc_hours, sin_ha_utc, cos_ha_utc) indexed by interval number.
+    The UTC-based hour angle is 15 * (utc_hours - 12); the true hour angle
+    only adds the day's constant 15 * correction, so each day's values are
+    obtained from these tables by angle addition rather than new sin/cos calls.
+    Cached per interval, since tables are built with only a few distinct ones.
+    """
+    utc_hours = tuple(
+        i * interval_minutes / 60.0 for i in range(intervals_per_day(interval_minutes))
+    )
+    ha_rad = [angles.hour_angle(h) * angles._DEG2RAD for h in utc_hours]
+    return (
+        utc_hours,
+        tuple(math.sin(h) for h in ha_rad),
+        tuple(math.cos(h) for h in ha_rad),
+    )
 
-def _generate_table(
-    config: LookupTableConfig,
-    entry_fn: Callable,
-    bytes_per_entry: int,
-) -> LookupTable:
-    """Shared table generation with UTC-indexed minutes."""
-    n_intervals = intervals_per_day(config.interval_minutes)
-    n_days = 366 if angles.leap_year(config.year) else 365
-    days: list[DayData] = []
 
-    lat_rad = angles.deg_to_rad(config.latitude)
-    sin_lat = math.sin(lat_rad)
-    cos_lat = math.cos(lat_rad)
+def _compute_day_grid(config: LookupTableConfig) -> list[tuple]:
+    """Precompute per-day solar parameters for every day of the table year.
 
+    Returns one (sunrise_sunset, sin_dec, cos_dec, correction) tuple per day.
+    Everything here is constant across a day's intervals, so computing it in
+    one up-front pass leaves only per-entry work in the interval loop.
+    """
+    n_days = 366 if angles.leap_year(config.year) else 365
+    sunrise_sunset = _sunrise_sunset_by_day(config.latitude)
+    grid = []
     for doy in range(1, n_days + 1):
-        ss = estimate_sunrise_sunset(config.latitude, doy)
         eot = angles.equation_of_time(doy)
-        decl = angles.solar_declination(doy)
-        dec_rad = angles.deg_to_rad(decl)
-        sin_dec = math.sin(dec_rad)
-        cos_dec = math.cos(dec_rad)
+        sin_dec, cos_dec, _ = _DECLINATION_TRIG[doy]
+        ss = sunrise_sunset[doy]
         correction = angles.utc_lst_correction(config.longitude, eot)
-        correction_minutes = correction * 60.0
+        grid.append((ss, sin_dec, cos_dec, correction))
+    return grid
 
+
+def _generate_day(
+    config: LookupTableConfig,
+    doy: int,
+    day_params: tuple,
+    sin_lat: float,
+    cos_lat: float,
+    entry_type: type,
+    entry_fn: Callable,
+) -> DayData:
+    """Generate one day's DayData from its _compute_day_grid parameters.
+
+    Reads nothing from other days, so days can be generated in any order.
+    """
+    ss, sin_dec, cos_dec, correction = day_params
+    interval_minutes = config.interval_minutes
+    n_intervals = intervals_per_day(interval_minutes)
+    n_values = len(fields(entry_type)) - 1
+    # Buffer entries outside sunrise/sunset need no angles at all
+    night_row = (math.nan,) * n_values
+    utc_hours, sin_ha_utc, cos_ha_utc = _interval_grid(interval_minutes)
+
+    correction_minutes = correction * 60.0
+    # Hour-angle offset from UTC to local solar time, constant for the day
+    ha_offset_rad = angles.DEGREES_PER_HOUR * correction * angles._DEG2RAD
+    sin_offset = math.sin(ha_offset_rad)
+    cos_offset = math.cos(ha_offset_rad)
+
+    if ss.sunrise == ss.sunset:
+        # Polar night (see _sunrise_sunset_from_cos_h): the sun never rises
+        intervals = range(0)
+        day_start = day_end = 0
+    elif ss.sunset - ss.sunrise >= 1440:
+        # Polar day: the sun is up at every UTC minute, whatever the longitude
+        intervals = range(n_intervals)
+        day_start, day_end = 0, n_intervals
+    else:
         sunrise_utc = int(ss.sunrise - correction_minutes)
         sunset_utc = int(ss.sunset - correction_minutes)
 
         start_minute = max(0, sunrise_utc - config.sunrise_buffer_minutes)
         end_minute = min(1439, sunset_utc + config.sunset_buffer_minutes)
 
-        # Ceiling division: first entry must be >= start_minute
-        first_interval = -(-start_minute // config.interval_minutes)
-        last_interval = min(end_minute // config.interval_minutes, n_intervals - 1)
-
-        entries = []
-        for interval in range(first_interval, last_interval + 1):
-            minutes = interval * config.interval_minutes
-            utc_hours = minutes / 60.0
-            pos = _compute_angles_fast(
-                sin_lat, cos_lat, sin_dec, cos_dec, correction, utc_hours
-            )
-            local_minutes = int(minutes + correction_minutes)
-            is_daylight = ss.sunrise <= local_minutes <= ss.sunset
-            entries.append(entry_fn(minutes, pos, is_daylight))
-
-        days.append(
-            DayData(
-                day_of_year=doy,
-                sunrise_minutes=ss.sunrise,
-                sunset_minutes=ss.sunset,
-                entries=entries,
-            )
+        # Ceiling division (start_minute >= 0): first entry must be >= start_minute
+        first_interval = (start_minute + interval_minutes - 1) // interval_minutes
+        last_interval = min(end_minute // interval_minutes, n_intervals - 1)
+
+        intervals = range(first_interval, last_interval + 1)
+
+        def local_minutes(interval):
+            return int(interval * interval_minutes + correction_minutes)
+
+        # Local minutes never decrease along the day, so the daylight entries
+        # form one contiguous run between two blocks of buffer entries
+        day_start = bisect.bisect_left(intervals, ss.sunrise, key=local_minutes)
+        day_end = bisect.bisect_right(intervals, ss.sunset, key=local_minutes)
+
+    rows = [night_row] * day_start
+    for interval in intervals[day_start:day_end]:
+        sin_utc = sin_ha_utc[interval]
+        cos_utc = cos_ha_utc[interval]
+        ha, zenith, azimuth = _compute_angles_fast(
+            sin_lat,
+            cos_lat,
+            sin_dec,
+            cos_dec,
+            sin_utc * cos_offset + cos_utc * sin_offset,
+            cos_utc * cos_offset - sin_utc * sin_offset,
+            correction,
+            utc_hours[interval],
         )
+        rows.append(entry_fn(ha, zenith, azimuth))
+    rows.extend([night_row] * (len(intervals) - day_end))
 
-    total_entries = sum(len(d.entries) for d in days)
+    if rows:
+        values = tuple(array("f", column) for column in zip(*rows))
+    else:
+        values = tuple(array("f") for _ in range(n_values))
+
+    return DayData(
+        day_of_year=doy,
+        sunrise_minutes=ss.sunrise,
+        sunset_minutes=ss.sunset,
+        minutes=range(
+            intervals.start * interval_minutes,
+            intervals.stop * interval_minutes,
+            interval_minutes,
+        ),
+        values=values,
+        entry_type=entry_type,
+    )
+
+
+def _generate_table(
+    config: LookupTableConfig,
+    entry_type: type,
+    entry_fn: Callable,
+    bytes_per_entry: int,
+) -> LookupTable:
+    """Shared table generation with UTC-indexed minutes.
+
+    entry_fn(hour_angle, zenith, azimuth) returns the angle values for one
+    daylight entry as a tuple, in entry_type field order; nighttime entries
+    are filled with NaN without computing any angles. Each day's values are
+    stored as float32 columns alongside a range of UTC minutes.
+    """
+    lat_rad = config.latitude * angles._DEG2RAD
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+
+    days = [
+        _generate_day(config, doy, day_params, sin_lat, cos_lat, entry_type, entry_fn)
+        for doy, day_params in enumerate(_compute_day_grid(config), start=1)
+    ]
+
+    total_entries = sum(len(d.minutes) for d in days)
     storage_kb = (total_entries * bytes_per_entry) / 1024.0
 
     return LookupTable(
         config=config,
         days=days,
         metadata=TableMetadata(
-            generated_at=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            generated_at=int(time.time()),
             total_entries=total_entries,
             storage_estimate_kb=storage_kb,
         ),
@@ -190,74 +362,88 @@ def _generate_table(
 
 def generate_single_axis_table(config: LookupTableConfig) -> LookupTable:
     """Generate a single-axis tracker lookup table."""
-    latitude = config.latitude
+    cos_lat = math.cos(config.latitude * angles._DEG2RAD)
 
-    def entry_fn(minutes, pos, is_daylight):
-        rotation = angles.single_axis_tilt(pos, latitude) if is_daylight else None
-        return SingleAxisEntry(minutes=minutes, rotation=rotation)
+    def entry_fn(hour_angle, zenith, azimuth):
+        # Same formula as angles.single_axis_tilt, with cos(latitude) hoisted
+        ha_rad = hour_angle * angles._DEG2RAD
+        return (math.atan(math.tan(ha_rad) / cos_lat) * angles._RAD2DEG,)
 
-    return _generate_table(config, entry_fn, 4)
+    return _generate_table(config, SingleAxisEntry, entry_fn, 4)
 
 
 def generate_dual_axis_table(config: LookupTableConfig) -> LookupTable:
     """Generate a dual-axis tracker lookup table."""
 
-    def entry_fn(minutes, pos, is_daylight):
-        if is_daylight:
-            da = angles.dual_axis_angles(pos)
-            return DualAxisEntry(
-                minutes=minutes, tilt=da.tilt, panel_azimuth=da.panel_azimuth
-            )
-        return DualAxisEntry(minutes=minutes, tilt=None, panel_azimuth=None)
+    def entry_fn(hour_angle, zenith, azimuth):
+        # Same as angles.dual_axis_angles: point the panel at the sun
+        return (zenith, angles.normalize_angle(azimuth + 180.0))
 
-    return _generate_table(config, entry_fn, 8)
+    return _generate_table(config, DualAxisEntry, entry_fn, 8)
 
 
-def _find_bracketing_entries(
-    entries: list, interval_minutes: int, minutes: int
-) -> tuple | None:
-    """Find the two entries bracketing the given minutes value.
+def _bracket_idx(day_minutes: range, minutes: int) -> tuple[int, float]:
+    """Find the entry at or before the given minutes value.
 
-    Returns (entry_before, entry_after, fraction) or None if outside range.
+    Returns (idx, fraction) where the value lies fraction of the way from
+    entry idx to entry idx + 1, or (-1, 0.0) if outside the day's range.
+    fraction is 0.0 on an entry boundary, so idx + 1 is only read when the
+    value lies strictly between two entries.
     """
-    if not entries:
-        return None
-    first_minutes = entries[0].minutes
-    last_minutes = entries[-1].minutes
-    if minutes < first_minutes or minutes > last_minutes:
-        return None
-
-    idx_before = min(
-        (minutes - first_minutes) // interval_minutes, len(entries) - 1
-    )
-    entry_before = entries[idx_before]
-    entry_after = entries[idx_before + 1] if idx_before + 1 < len(entries) else None
-    t0 = entry_before.minutes
-
-    if entry_after is None or minutes == t0:
-        return (entry_before, None, 0.0)
-
-    t1 = entry_after.minutes
-    fraction = (minutes - t0) / (t1 - t0)
-    return (entry_before, entry_after, fraction)
+    first_minutes = day_minutes.start
+    interval_minutes = day_minutes.step
+    # The last entry is at stop - step; an empty range fails this check too
+    if not first_minutes <= minutes <= day_minutes.stop - interval_minutes:
+        return -1, 0.0
+    idx, offset = divmod(minutes - first_minutes, interval_minutes)
+    return idx, offset / interval_minutes
 
 
 def lookup_single_axis(
     table: LookupTable, day_of_year: int, minutes: int
 ) -> SingleAxisEntry | None:
     """Look up single-axis rotation from table with linear interpolation."""
-    entries = table.days[day_of_year - 1].entries
-    interval_minutes = table.config.interval_minutes
-    result = _find_bracketing_entries(entries, interval_minutes, minutes)
-    if result is None:
+    day = table.days[day_of_year - 1]
+    idx, fraction = _bracket_idx(day.minutes, minutes)
+    if idx < 0:
         return None
-    before, after, fraction = result
-    if after is None:
-        return SingleAxisEntry(minutes=minutes, rotation=before.rotation)
-    return SingleAxisEntry(
-        minutes=minutes,
-        rotation=_interpolate_linear(before.rotation, after.rotation, fraction),
-    )
+    (rotation,) = day.values
+    r = rotation[idx]
+    if fraction:
+        r += fraction * (rotation[idx + 1] - r)
+    return SingleAxisEntry(minutes=minutes, rotation=_value_or_none(r))
+
+
+def lookup_single_axis_batch(
+    table: LookupTable, days_of_year: Sequence[int], minutes: Sequence[int]
+) -> list[float | None]:
+    """Look up single-axis rotations for many (day_of_year, minutes) pairs.
+
+    Returns one rotation per pair, None where lookup_single_axis would
+    return None or a nighttime entry. Table attributes and the current
+    day's columns are resolved once per run of equal days rather than
+    once per query.
+    """
+    interval_minutes = table.config.interval_minutes
+    rotations: list[float | None] = []
+    current_doy = None
+    for doy, m in zip(days_of_year, minutes, strict=True):
+        if doy != current_doy:
+            day = table.days[doy - 1]
+            (rotation,) = day.values
+            first_minutes = day.minutes.start
+            last_minutes = day.minutes.stop - interval_minutes
+            current_doy = doy
+        # _bracket_idx, inlined with the day's range hoisted out of the loop
+        if m < first_minutes or m > last_minutes:
+            rotations.append(None)
+            continue
+        idx, offset = divmod(m - first_minutes, interval_minutes)
+        r = rotation[idx]
+        if offset:
+            r += offset / interval_minutes * (rotation[idx + 1] - r)
+        rotations.append(_value_or_none(r))
+    return rotations
 
 
 def lookup_dual_axis(
@@ -267,25 +453,56 @@ def lookup_dual_axis(
 
     Uses interpolate_angle for panel_azimuth to handle 360 deg wraparound.
     """
-    entries = table.days[day_of_year - 1].entries
-    interval_minutes = table.config.interval_minutes
-    result = _find_bracketing_entries(entries, interval_minutes, minutes)
-    if result is None:
+    day = table.days[day_of_year - 1]
+    idx, fraction = _bracket_idx(day.minutes, minutes)
+    if idx < 0:
         return None
-    before, after, fraction = result
-    if after is None:
-        return DualAxisEntry(
-            minutes=minutes, tilt=before.tilt, panel_azimuth=before.panel_azimuth
-        )
+    tilt, panel_azimuth = day.values
+    t = tilt[idx]
+    a = panel_azimuth[idx]
+    if fraction:
+        t += fraction * (tilt[idx + 1] - t)
+        a = _interpolate_angle_nan(a, panel_azimuth[idx + 1], fraction)
     return DualAxisEntry(
-        minutes=minutes,
-        tilt=_interpolate_linear(before.tilt, after.tilt, fraction),
-        panel_azimuth=interpolate_angle(
-            before.panel_azimuth, after.panel_azimuth, fraction
-        ),
+        minutes=minutes, tilt=_value_or_none(t), panel_azimuth=_value_or_none(a)
     )
 
 
+def lookup_dual_axis_batch(
+    table: LookupTable, days_of_year: Sequence[int], minutes: Sequence[int]
+) -> list[tuple[float, float] | None]:
+    """Look up dual-axis angles for many (day_of_year, minutes) pairs.
+
+    Returns one (tilt, panel_azimuth) tuple per pair, None where
+    lookup_dual_axis would return None or a nighttime entry. Same
+    amortization as lookup_single_axis_batch.
+    """
+    interval_minutes = table.config.interval_minutes
+    results: list[tuple[float, float] | None] = []
+    current_doy = None
+    for doy, m in zip(days_of_year, minutes, strict=True):
+        if doy != current_doy:
+            day = table.days[doy - 1]
+            tilt, panel_azimuth = day.values
+            first_minutes = day.minutes.start
+            last_minutes = day.minutes.stop - interval_minutes
+            current_doy = doy
+        # _bracket_idx, inlined with the day's range hoisted out of the loop
+        if m < first_minutes or m > last_minutes:
+            results.append(None)
+            continue
+        idx, offset = divmod(m - first_minutes, interval_minutes)
+        t = tilt[idx]
+        a = panel_azimuth[idx]
+        if offset:
+            fraction = offset / interval_minutes
+            t += fraction * (tilt[idx + 1] - t)
+            a = _interpolate_angle_nan(a, panel_azimuth[idx + 1], fraction)
+        # tilt and panel_azimuth are NaN together at night
+        results.append(None if _value_or_none(t) is None else (t, a))
+    return results
+
+
 def table_to_compact(table: LookupTable) -> list:
     """Strip metadata and return nested lists of angle values.
 
@@ -295,10 +512,20 @@ def table_to_compact(table: LookupTable) -> list:
     For dual-axis tables (entries have tilt and panel_azimuth):
       [[[tilt, panel_azimuth] ...] ...]
     """
-    sample_entry = table.days[0].entries[0]
-    if isinstance(sample_entry, SingleAxisEntry):
-        return [[e.rotation for e in day.entries] for day in table.days]
+    # tolist() boxes each column in one C-level pass; NaN marks nighttime,
+    # and tilt and panel_azimuth are always NaN together. The inline v == v
+    # stands in for _value_or_none here: a call per value would give back
+    # most of the measured speedup on full-table exports.
+    if table.days[0].entry_type is SingleAxisEntry:
+        return [
+            [v if v == v else None for v in day.values[0].tolist()]
+            for day in table.days
+        ]
     else:
         return [
-            [[e.tilt, e.panel_azimuth] for e in day.entries] for day in table.days
+            [
+                [t, a] if t == t else [None, None]
+                for t, a in zip(day.values[0].tolist(), day.values[1].tolist())
+            ]
+            for day in table.days
         ]
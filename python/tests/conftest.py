@@ -1 +1,38 @@
 """Shared test configuration."""
+
+import pytest
+
+from solar_tracker._types import LookupTableConfig
+from solar_tracker.lookup_table import (
+    generate_dual_axis_table,
+    generate_single_axis_table,
+)
+
+# Tables are immutable, so each distinct config is generated once per run
+# and shared by every test that needs it.
+
+
+@pytest.fixture(scope="session")
+def single_axis_table_15min():
+    return generate_single_axis_table(LookupTableConfig(interval_minutes=15))
+
+
+@pytest.fixture(scope="session")
+def dual_axis_table_15min():
+    return generate_dual_axis_table(LookupTableConfig(interval_minutes=15))
+
+
+@pytest.fixture(scope="session")
+def single_axis_table_30min():
+    return generate_single_axis_table(LookupTableConfig(interval_minutes=30))
+
+
+@pytest.fixture(scope="session")
+def dual_axis_table_30min():
+    return generate_dual_axis_table(LookupTableConfig(interval_minutes=30))
+
+
+@pytest.fixture(scope="session")
+def polar_single_axis_table_30min():
+    config = LookupTableConfig(interval_minutes=30, latitude=80.0, longitude=-150.0)
+    return generate_single_axis_table(config)
@@ -16,8 +16,11 @@ from solar_tracker.angles import (
     rad_to_deg,
     seasonal_tilt_adjustment,
     single_axis_tilt,
+    solar_angles_at,
+    solar_azimuth,
     solar_declination,
     solar_position,
+    solar_position_from_ts,
     solar_zenith_angle,
 )
 
@@ -313,6 +316,59 @@ class TestAzimuthAlwaysNormalized:
         assert 0.0 <= pos.azimuth < 360.0
 
 
+class TestSolarAnglesAtMatchesComponents:
+    @pytest.mark.parametrize(
+        "lat,decl,correction,utc_hours",
+        [
+            (39.8, 0.0, -6.1, 18.0),
+            (0.0, 23.45, 0.0, 12.0),
+            (-33.9, -23.45, 10.1, 3.5),
+            (70.0, 20.0, 1.0, 23.75),
+        ],
+    )
+    def test_matches(self, lat, decl, correction, utc_hours):
+        lst, ha, z, alt, azim = solar_angles_at(lat, decl, correction, utc_hours)
+        assert ha == pytest.approx(hour_angle(lst), abs=1e-10)
+        assert z == pytest.approx(solar_zenith_angle(lat, decl, ha), abs=1e-10)
+        assert alt == pytest.approx(90.0 - z, abs=1e-10)
+        assert azim == pytest.approx(solar_azimuth(lat, decl, ha), abs=1e-10)
+
+
+class TestSolarPositionCache:
+    def test_same_instant_different_zones(self):
+        a = solar_position(39.8, -89.6, _dt(2026, 3, 21, 12, 0, -6))
+        b = solar_position(39.8, -89.6, _dt(2026, 3, 21, 18, 0, 0))
+        assert a is b
+
+    def test_different_location_not_shared(self):
+        a = solar_position(39.8, -89.6, _dt(2026, 3, 21, 12, 0, -6))
+        b = solar_position(40.0, -89.6, _dt(2026, 3, 21, 12, 0, -6))
+        assert a != b
+
+
+class TestSolarPositionFromTimestamp:
+    @pytest.mark.parametrize(
+        "yr,mo,dy,hr,mn,offset_hours",
+        [
+            (2026, 3, 21, 12, 0, -6),
+            (2024, 2, 29, 23, 59, 0),
+            (2026, 12, 31, 18, 30, -8),
+            (1969, 12, 31, 23, 0, 0),
+        ],
+    )
+    def test_matches_datetime(self, yr, mo, dy, hr, mn, offset_hours):
+        dt = _dt(yr, mo, dy, hr, mn, offset_hours)
+        assert solar_position_from_ts(39.8, -89.6, dt.timestamp()) == solar_position(
+            39.8, -89.6, dt
+        )
+
+    def test_fractional_seconds_truncated(self):
+        dt = _dt(2026, 6, 21, 12, 0, 0)
+        assert solar_position_from_ts(
+            39.8, -89.6, dt.timestamp() + 0.75
+        ) == solar_position(39.8, -89.6, dt)
+
+
 class TestNaiveDatetimeRejected:
     def test_raises_value_error(self):
         with pytest.raises(ValueError, match="timezone-aware"):
@@ -328,6 +384,25 @@ class TestEquationOfTimeBounded:
             assert -15.0 <= eot <= 17.0, f"Day {n}: {eot}"
 
 
+class TestPerDayTables:
+    def test_tables_match_formulas(self):
+        from solar_tracker.angles import (
+            _equation_of_time,
+            _solar_declination,
+            equation_of_time,
+        )
+
+        for n in range(1, 367):
+            assert equation_of_time(n) == _equation_of_time(n)
+            assert solar_declination(n) == _solar_declination(n)
+
+    def test_out_of_range_falls_back_to_formula(self):
+        from solar_tracker.angles import _solar_declination
+
+        assert solar_declination(400) == _solar_declination(400)
+        assert solar_declination(172.5) == _solar_declination(172.5)
+
+
 class TestZenithNonNegative:
     @pytest.mark.parametrize(
         "lat,decl,ha",
@@ -1,5 +1,10 @@
 """Port of lookup_table_test.clj — lookup table tests."""
 
+import dataclasses
+import datetime
+import math
+import time
+
 import pytest
 
 from solar_tracker._types import (
@@ -7,7 +12,15 @@ from solar_tracker._types import (
     LookupTableConfig,
     SingleAxisEntry,
 )
-from solar_tracker.angles import day_of_year
+from solar_tracker.angles import (
+    day_of_year,
+    dual_axis_angles,
+    equation_of_time,
+    single_axis_tilt,
+    solar_declination,
+    solar_position,
+    utc_lst_correction,
+)
 from solar_tracker.lookup_table import (
     DEFAULT_CONFIG,
     doy_to_month_day,
@@ -17,7 +30,9 @@ from solar_tracker.lookup_table import (
     interpolate_angle,
     intervals_per_day,
     lookup_dual_axis,
+    lookup_dual_axis_batch,
     lookup_single_axis,
+    lookup_single_axis_batch,
     minutes_to_time,
     table_to_compact,
     time_to_minutes,
@@ -80,6 +95,20 @@ class TestDoyMonthDay:
         assert doy_to_month_day(2026, 365) == (12, 31)
         assert doy_to_month_day(2024, 366) == (12, 31)
 
+    def test_out_of_range_days_clamp(self):
+        assert doy_to_month_day(2026, 0) == (1, 0)
+        assert doy_to_month_day(2026, -5) == (1, -5)
+        assert doy_to_month_day(2026, 366) == (12, 31)
+        assert doy_to_month_day(2024, 400) == (12, 31)
+
+    @pytest.mark.parametrize("year", [2024, 2026, 2100])
+    def test_every_day_matches_calendar(self, year):
+        start = datetime.date(year, 1, 1).toordinal()
+        n_days = datetime.date(year, 12, 31).timetuple().tm_yday
+        for doy in range(1, n_days + 1):
+            date = datetime.date.fromordinal(start + doy - 1)
+            assert doy_to_month_day(year, doy) == (date.month, date.day)
+
 
 class TestSunriseSunsetEstimation:
     def test_equinox_12h_daylight(self):
@@ -104,16 +133,159 @@ class TestSunriseSunsetEstimation:
         assert ss.sunrise == 0
         assert ss.sunset == 1440
 
+    @pytest.mark.parametrize("latitude", [0.0, 39.8, -66.0, 80.0])
+    def test_tabulated_declination_matches_direct_formula(self, latitude):
+        from solar_tracker.lookup_table import _sunrise_sunset_from_cos_h
+
+        tan_lat = math.tan(math.radians(latitude))
+        for doy in range(1, 367):
+            decl = math.radians(solar_declination(doy))
+            expected = _sunrise_sunset_from_cos_h(-1.0 * tan_lat * math.tan(decl))
+            assert estimate_sunrise_sunset(latitude, doy) == expected
+
+    def test_does_not_fill_year_cache(self):
+        from solar_tracker.lookup_table import _sunrise_sunset_by_day
+
+        before = _sunrise_sunset_by_day.cache_info()
+        estimate_sunrise_sunset(12.345, 100)
+        assert _sunrise_sunset_by_day.cache_info() == before
+
+    def test_non_integer_day_computed_directly(self):
+        assert estimate_sunrise_sunset(39.8, 172.0) == estimate_sunrise_sunset(
+            39.8, 172
+        )
+
     def test_polar_night(self):
         ss = estimate_sunrise_sunset(80.0, 355)
         assert ss.sunrise == ss.sunset
 
 
+class TestDaySunriseSunsetMatchesEstimate:
+    @pytest.mark.parametrize("latitude", [39.8, -33.9, 70.0, 80.0])
+    def test_all_days(self, latitude):
+        config = LookupTableConfig(interval_minutes=60, latitude=latitude)
+        table = generate_single_axis_table(config)
+        for day in table.days:
+            ss = estimate_sunrise_sunset(latitude, day.day_of_year)
+            assert (day.sunrise_minutes, day.sunset_minutes) == (ss.sunrise, ss.sunset)
+
+
+class TestEntriesMatchReferenceAngles:
+    """Every stored entry against the per-instant angle functions.
+
+    Covers the buffer entries, the sunrise/sunset boundary and each daylight
+    entry, at float32 precision.
+    """
+
+    # (latitude, longitude, interval); 1-minute steps land on sunrise/sunset exactly
+    SITES = [
+        (39.8, -89.6, 10),
+        (-33.9, 151.2, 10),
+        (0.0, 0.0, 10),
+        (70.0, 20.0, 1),
+        (80.0, -150.0, 10),
+    ]
+    DAYS = [1, 80, 140, 172, 266, 355]
+
+    def _check(self, table, value_names, check_entry):
+        config = table.config
+        lat, lon = config.latitude, config.longitude
+        year_start = datetime.datetime(config.year, 1, 1, tzinfo=datetime.timezone.utc)
+        for doy in self.DAYS:
+            day = table.days[doy - 1]
+            ss = estimate_sunrise_sunset(lat, doy)
+            correction_minutes = utc_lst_correction(lon, equation_of_time(doy)) * 60.0
+            if ss.sunrise == ss.sunset:
+                assert day.entries == []
+            elif ss.sunset - ss.sunrise < 1440:
+                start = (
+                    int(ss.sunrise - correction_minutes) - config.sunrise_buffer_minutes
+                )
+                end = int(ss.sunset - correction_minutes) + config.sunset_buffer_minutes
+                assert [e.minutes for e in day.entries] == [
+                    m
+                    for m in range(0, 1440, config.interval_minutes)
+                    if start <= m <= end
+                ]
+            for entry in day.entries:
+                local = int(entry.minutes + correction_minutes)
+                if ss.sunrise == ss.sunset:
+                    daylight = False
+                elif ss.sunset - ss.sunrise >= 1440:
+                    daylight = True
+                else:
+                    daylight = ss.sunrise <= local <= ss.sunset
+                if not daylight:
+                    assert all(getattr(entry, name) is None for name in value_names)
+                    continue
+                at = year_start + datetime.timedelta(
+                    days=doy - 1, minutes=entry.minutes
+                )
+                check_entry(
+                    entry,
+                    solar_position(lat, lon, at),
+                    f"day {doy} minute {entry.minutes}",
+                )
+
+    @pytest.mark.parametrize("latitude,longitude,interval", SITES)
+    def test_single_axis(self, latitude, longitude, interval):
+        config = LookupTableConfig(
+            interval_minutes=interval, latitude=latitude, longitude=longitude
+        )
+
+        def check(entry, pos, where):
+            expected = single_axis_tilt(pos, latitude)
+            assert entry.rotation == pytest.approx(expected, abs=1e-4), where
+
+        self._check(generate_single_axis_table(config), ("rotation",), check)
+
+    @pytest.mark.parametrize("latitude,longitude,interval", SITES)
+    def test_dual_axis(self, latitude, longitude, interval):
+        config = LookupTableConfig(
+            interval_minutes=interval, latitude=latitude, longitude=longitude
+        )
+
+        def check(entry, pos, where):
+            expected = dual_axis_angles(pos)
+            assert entry.tilt == pytest.approx(expected.tilt, abs=1e-4), where
+            diff = (
+                entry.panel_azimuth - expected.panel_azimuth + 180.0
+            ) % 360.0 - 180.0
+            assert abs(diff) < 1e-4, where
+
+        self._check(generate_dual_axis_table(config), ("tilt", "panel_azimuth"), check)
+
+
+class TestPolarDays:
+    @pytest.fixture
+    def table(self, polar_single_axis_table_30min):
+        return polar_single_axis_table_30min
+
+    def test_polar_night_has_no_entries(self, table):
+        day = table.days[354]
+        assert (day.sunrise_minutes, day.sunset_minutes) == (720, 720)
+        assert day.entries == []
+        assert lookup_single_axis(table, 355, 720) is None
+
+    def test_polar_day_covers_every_utc_minute(self, table):
+        day = table.days[171]
+        assert (day.sunrise_minutes, day.sunset_minutes) == (0, 1440)
+        assert day.minutes == range(0, 1440, 30)
+        assert all(e.rotation is not None for e in day.entries)
+        assert lookup_single_axis(table, 172, 100).rotation is not None
+
+    def test_polar_day_not_clipped_east_of_greenwich(self):
+        config = LookupTableConfig(interval_minutes=60, latitude=80.0, longitude=30.0)
+        table = generate_dual_axis_table(config)
+        day = table.days[171]
+        assert day.minutes == range(0, 1440, 60)
+        assert all(e.tilt is not None for e in day.entries)
+
+
 class TestSingleAxisOneDay:
     @pytest.fixture
-    def table(self):
-        config = LookupTableConfig(interval_minutes=15)
-        return generate_single_axis_table(config)
+    def table(self, single_axis_table_15min):
+        return single_axis_table_15min
 
     def test_day_80_structure(self, table):
         day_80 = table.days[79]
@@ -150,9 +322,8 @@ class TestSingleAxisOneDay:
 
 class TestDualAxisOneDay:
     @pytest.fixture
-    def table(self):
-        config = LookupTableConfig(interval_minutes=15)
-        return generate_dual_axis_table(config)
+    def table(self, dual_axis_table_15min):
+        return dual_axis_table_15min
 
     def test_day_80_structure(self, table):
         day_80 = table.days[79]
@@ -172,10 +343,9 @@ class TestDualAxisOneDay:
 
 
 class TestFullYearGeneration:
-    @pytest.fixture(scope="class")
-    def table(self):
-        config = LookupTableConfig(interval_minutes=30)
-        return generate_single_axis_table(config)
+    @pytest.fixture
+    def table(self, single_axis_table_30min):
+        return single_axis_table_30min
 
     def test_365_days(self, table):
         assert len(table.days) == 365
@@ -184,6 +354,11 @@ class TestFullYearGeneration:
         assert table.metadata.total_entries > 0
         assert table.metadata.storage_estimate_kb > 0
 
+    def test_generated_at_is_epoch_seconds(self, table):
+        generated_at = table.metadata.generated_at
+        assert isinstance(generated_at, int)
+        assert abs(generated_at - time.time()) < 3600
+
     def test_every_day_has_entries(self, table):
         for day in table.days:
             assert len(day.entries) > 0, f"Day {day.day_of_year} has no entries"
@@ -194,12 +369,35 @@ class TestFullYearGeneration:
             assert isinstance(entry.minutes, int)
             assert entry.rotation is None or isinstance(entry.rotation, (int, float))
 
+    def test_regenerated_days_compare_equal(self, table):
+        again = generate_single_axis_table(table.config)
+        assert again.days == table.days
+        assert again.days[0] != table.days[1]
+
+    def test_days_with_different_values_compare_unequal(self, table):
+        day = table.days[171]
+        (rotation,) = day.values
+        changed = rotation[:]
+        changed[len(changed) // 2] += 1.0
+        assert dataclasses.replace(day, values=(changed,)) != day
+        assert dataclasses.replace(day, values=(rotation[:],)) == day
+
+    def test_columns_match_entries(self, table):
+        day = table.days[171]
+        (rotation,) = day.values
+        assert len(day.minutes) == len(rotation) == len(day.entries)
+        for m, r, entry in zip(day.minutes, rotation, day.entries):
+            assert entry.minutes == m
+            if math.isnan(r):
+                assert entry.rotation is None
+            else:
+                assert entry.rotation == r
+
 
 class TestLookupSingleAxis:
-    @pytest.fixture(scope="class")
-    def table(self):
-        config = LookupTableConfig(interval_minutes=15)
-        return generate_single_axis_table(config)
+    @pytest.fixture
+    def table(self, single_axis_table_15min):
+        return single_axis_table_15min
 
     def test_exact_boundary(self, table):
         result = lookup_single_axis(table, 80, 1080)
@@ -218,12 +416,37 @@ class TestLookupSingleAxis:
             hi = max(at_1080.rotation, at_1095.rotation)
             assert lo - 0.01 <= result.rotation <= hi + 0.01
 
+    def test_first_and_last_entry(self, table):
+        entries = table.days[79].entries
+        for entry in (entries[0], entries[-1]):
+            result = lookup_single_axis(table, 80, entry.minutes)
+            assert result == entry
+        assert lookup_single_axis(table, 80, entries[-1].minutes + 1) is None
+
+
+class TestLookupSingleAxisBatch:
+    @pytest.fixture
+    def table(self, single_axis_table_15min):
+        return single_axis_table_15min
+
+    def test_matches_scalar_lookup(self, table):
+        doys = [80, 80, 80, 80, 172, 355, 80, 1]
+        minutes = [0, 1080, 1087, 1439, 1000, 1100, 1095, 900]
+        rotations = lookup_single_axis_batch(table, doys, minutes)
+        assert len(rotations) == len(doys)
+        for doy, m, rotation in zip(doys, minutes, rotations):
+            scalar = lookup_single_axis(table, doy, m)
+            assert rotation == (None if scalar is None else scalar.rotation)
+
+    def test_length_mismatch_raises(self, table):
+        with pytest.raises(ValueError):
+            lookup_single_axis_batch(table, [80, 81], [720])
+
 
 class TestLookupDualAxis:
-    @pytest.fixture(scope="class")
-    def table(self):
-        config = LookupTableConfig(interval_minutes=15)
-        return generate_dual_axis_table(config)
+    @pytest.fixture
+    def table(self, dual_axis_table_15min):
+        return dual_axis_table_15min
 
     def test_exact_boundary(self, table):
         result = lookup_dual_axis(table, 80, 1080)
@@ -238,19 +461,38 @@ class TestLookupDualAxis:
         assert result.panel_azimuth is not None
 
 
+class TestLookupDualAxisBatch:
+    @pytest.fixture
+    def table(self, dual_axis_table_15min):
+        return dual_axis_table_15min
+
+    def test_matches_scalar_lookup(self, table):
+        doys = [80, 80, 80, 80, 172, 355, 80, 1]
+        minutes = [0, 1080, 1087, 1439, 1000, 1100, 1095, 900]
+        results = lookup_dual_axis_batch(table, doys, minutes)
+        assert len(results) == len(doys)
+        for doy, m, result in zip(doys, minutes, results):
+            scalar = lookup_dual_axis(table, doy, m)
+            if scalar is None or scalar.tilt is None:
+                assert result is None
+            else:
+                assert result == (scalar.tilt, scalar.panel_azimuth)
+
+    def test_length_mismatch_raises(self, table):
+        with pytest.raises(ValueError):
+            lookup_dual_axis_batch(table, [80, 81], [720])
+
+
 class TestLookupOutsideRange:
-    def test_nighttime_returns_none(self):
-        config = LookupTableConfig(interval_minutes=15)
-        table = generate_single_axis_table(config)
+    def test_nighttime_returns_none(self, single_axis_table_15min):
+        table = single_axis_table_15min
         assert lookup_single_axis(table, 80, 0) is None
         assert lookup_single_axis(table, 80, 120) is None
 
 
 class TestCompactExport:
-    def test_single_axis(self):
-        config = LookupTableConfig(interval_minutes=30)
-        table = generate_single_axis_table(config)
-        compact = table_to_compact(table)
+    def test_single_axis(self, single_axis_table_30min):
+        compact = table_to_compact(single_axis_table_30min)
         assert len(compact) == 365
         assert isinstance(compact, list)
         assert isinstance(compact[0], list)
@@ -258,10 +500,8 @@ class TestCompactExport:
             for v in day_vals:
                 assert v is None or isinstance(v, (int, float))
 
-    def test_dual_axis(self):
-        config = LookupTableConfig(interval_minutes=30)
-        table = generate_dual_axis_table(config)
-        compact = table_to_compact(table)
+    def test_dual_axis(self, dual_axis_table_30min):
+        compact = table_to_compact(dual_axis_table_30min)
         assert len(compact) == 365
         assert isinstance(compact, list)
         sample = next(v for v in compact[0] if v is not None)
@@ -283,6 +523,38 @@ class TestInterpolateAngleWraparound:
         result = interpolate_angle(10.0, 350.0, 0.5)
         assert result == pytest.approx(0.0, abs=0.01)
 
+    @pytest.mark.parametrize(
+        "a1,a2,fraction,expected",
+        [
+            (350.0, 10.0, 0.25, 355.0),
+            (10.0, 350.0, 0.25, 5.0),
+            (359.0, 1.0, 1.0, 1.0),
+            (90.0, 270.5, 0.5, 0.25),
+            (270.0, 90.5, 0.5, 180.25),
+        ],
+    )
+    def test_shortest_arc(self, a1, a2, fraction, expected):
+        assert interpolate_angle(a1, a2, fraction) == pytest.approx(expected, abs=1e-9)
+
+    @pytest.mark.parametrize(
+        "a1,a2,expected",
+        [
+            (0.0, 180.0, 90.0),
+            (90.0, 270.0, 180.0),
+            (180.0, 0.0, 90.0),
+            (270.0, 90.0, 180.0),
+        ],
+    )
+    def test_exact_half_turn_keeps_direction(self, a1, a2, expected):
+        # Matches the Rust and Clojure implementations: +180 and -180 are kept
+        assert interpolate_angle(a1, a2, 0.5) == expected
+
     def test_returns_none_for_nil_input(self):
         assert interpolate_angle(None, 10.0, 0.5) is None
         assert interpolate_angle(10.0, None, 0.5) is None
+
+    def test_nan_propagates_in_internal_form(self):
+        from solar_tracker.lookup_table import _interpolate_angle_nan
+
+        assert math.isnan(_interpolate_angle_nan(math.nan, 10.0, 0.5))
+        assert math.isnan(_interpolate_angle_nan(10.0, math.nan, 0.5))